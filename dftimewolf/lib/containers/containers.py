@@ -1,5 +1,11 @@
 # -*- coding: utf-8 -*-
-"""Attribute container definitions."""
+"""Attribute container definitions.
+
+The __slots__ of each container are ordered with the attributes that are
+most frequently accessed when iterating over containers first.
+"""
+
+import hashlib
 
 from dftimewolf.lib.containers import interface
 
@@ -11,6 +17,7 @@ class FSPath(interface.AttributeContainer):
     path (str): Filesystem path.
   """
   CONTAINER_TYPE = 'fspath'
+  __slots__ = ('path',)
 
   def __init__(self, path=None):
     """Initializes the FSPath object.
@@ -30,6 +37,7 @@ class RemoteFSPath(FSPath):
     path (str): Filesystem path.
   """
   CONTAINER_TYPE = 'remotefspath'
+  __slots__ = ('hostname',)
 
   def __init__(self, path=None, hostname=None):
     """Initializes the FSPath object.
@@ -54,6 +62,7 @@ class Report(interface.AttributeContainer):
       'type', 'values' keys.
   """
   CONTAINER_TYPE = 'report'
+  __slots__ = ('module_name', 'text_format', 'text', 'attributes')
 
   def __init__(
       self, module_name, text, text_format='plaintext', attributes=None):
@@ -88,6 +97,7 @@ class GCPLogs(interface.AttributeContainer):
     project_name (str): name of the project that was queried.
   """
   CONTAINER_TYPE = 'gcp_logs'
+  __slots__ = ('path', 'project_name', 'filter_expression')
 
   def __init__(self, path, filter_expression, project_name):
     """Initializes the analysis report.
@@ -117,6 +127,7 @@ class AWSLogs(interface.AttributeContainer):
         'YYYY-MM-DD HH:MM:SS.US'.
   """
   CONTAINER_TYPE = 'aws_logs'
+  __slots__ = ('path', 'profile_name', 'query_filter', 'start_time', 'end_time')
 
   def __init__(self, path, profile_name, query_filter, start_time, end_time):
     """Initializes the analysis report.
@@ -145,6 +156,7 @@ class ThreatIntelligence(interface.AttributeContainer):
     path (string): path to the indicator data (e.g. file).
   """
   CONTAINER_TYPE = 'threat_intelligence'
+  __slots__ = ('path', 'name', 'indicator')
 
   def __init__(self, name, indicator, path):
     """Initializes the Threat Intelligence container.
@@ -168,6 +180,7 @@ class TicketAttribute(interface.AttributeContainer):
     value (str): Value of the attribute.
   """
   CONTAINER_TYPE = 'ticketattribute'
+  __slots__ = ('name', 'value', 'type')
 
   def __init__(self, type_, name, value):
     """Initializes the attribute.
@@ -192,6 +205,7 @@ class File(interface.AttributeContainer):
     description (str): Longer description of the file.
   """
   CONTAINER_TYPE = 'file'
+  __slots__ = ('path', 'name', 'description')
 
   def __init__(self, name, path, description=None):
     """Initializes the attribute.
@@ -218,6 +232,7 @@ class ForensicsVM(interface.AttributeContainer):
         {gcp,aws,azure}.
   """
   CONTAINER_TYPE = 'forensics_vm'
+  __slots__ = ('name', 'evidence_disk', 'platform')
 
   def __init__(self, name, evidence_disk, platform):
     super(ForensicsVM, self).__init__()
@@ -233,6 +248,7 @@ class URL(interface.AttributeContainer):
     path (str): The full path to the URL.
   """
   CONTAINER_TYPE = 'url'
+  __slots__ = ('path',)
 
   def __init__(self, path):
     super(URL, self).__init__()
@@ -249,12 +265,79 @@ class DataFrame(interface.AttributeContainer):
   """
 
   CONTAINER_TYPE = 'data_frame'
+  __slots__ = ('data_frame', 'description', 'name', '_cached_path')
 
   def __init__(self, data_frame, description, name):
     super(DataFrame, self).__init__()
     self.data_frame = data_frame
     self.description = description
     self.name = name
+    self._cached_path = None
+
+  def WriteToCache(self, path):
+    """Writes the data frame to a cache file.
+
+    The data frame is written in the Feather format, or as zstd compressed
+    Parquet if Feather cannot represent it (e.g. it has a non-default index).
+    Writing to the path the data frame was last cached to is a no-op, so the
+    data frame should not be modified once it has been cached.
+
+    Args:
+      path (str): path of the cache file.
+    """
+    if path == self._cached_path:
+      return
+
+    try:
+      self.data_frame.to_feather(path)
+    except ValueError:
+      self.data_frame.to_parquet(path, compression='zstd')
+    self._cached_path = path
+
+  def GetContentHash(self):
+    """Computes a hash of the content of the data frame.
+
+    Rows are hashed by pandas' vectorized hashing, which is much faster than
+    pickling the data frame, and the resulting row hashes are digested
+    together with the column names.
+
+    Returns:
+      str: hexadecimal digest of the data frame content.
+    """
+    # pandas is only needed by recipes that use data frames.
+    import pandas  # pylint: disable=import-outside-toplevel
+
+    digest = hashlib.blake2b(digest_size=16)
+    for column_name in self.data_frame.columns:
+      digest.update(str(column_name).encode('utf-8'))
+      digest.update(b'\0')
+    row_hashes = pandas.util.hash_pandas_object(self.data_frame, index=True)
+    digest.update(row_hashes.values.tobytes())
+    return digest.hexdigest()
+
+  @classmethod
+  def ReadFromCache(cls, path, description, name):
+    """Reads a data frame container from a cache file.
+
+    Args:
+      path (str): path of a cache file written by WriteToCache().
+      description (str): Description of the data in the data frame.
+      name (str): Name of the data frame.
+
+    Returns:
+      DataFrame: data frame container.
+    """
+    # pandas is only needed by recipes that use data frames.
+    import pandas  # pylint: disable=import-outside-toplevel
+
+    try:
+      data_frame = pandas.read_feather(path)
+    except ValueError:
+      data_frame = pandas.read_parquet(path)
+
+    container = cls(data_frame, description, name)
+    container._cached_path = path  # pylint: disable=protected-access
+    return container
 
 
 class Host(interface.AttributeContainer):
@@ -266,6 +349,7 @@ class Host(interface.AttributeContainer):
   """
 
   CONTAINER_TYPE = 'host'
+  __slots__ = ('hostname', 'platform')
 
   def __init__(self, hostname, platform='unknown'):
     super(Host, self).__init__()
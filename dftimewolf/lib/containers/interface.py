@@ -16,6 +16,10 @@ class AttributeContainer(object):
   """
   CONTAINER_TYPE = None
 
+  # Subclasses declare their attributes in __slots__ so that instances do not
+  # carry a per-instance __dict__.
+  __slots__ = ()
+
   # TODO: note that this method is only used by tests.
   def GetAttributeNames(self):
     """Retrieves the names of all attributes.
@@ -24,8 +28,14 @@ class AttributeContainer(object):
       list[str]: attribute names.
     """
     attribute_names = []
-    for attribute_name in iter(self.__dict__.keys()):
-      # Not using startswith to improve performance.
+    for cls in type(self).__mro__:
+      for attribute_name in cls.__dict__.get('__slots__', ()):
+        # Not using startswith to improve performance.
+        if attribute_name[0] == '_' or not hasattr(self, attribute_name):
+          continue
+        attribute_names.append(attribute_name)
+
+    for attribute_name in iter(getattr(self, '__dict__', {}).keys()):
       if attribute_name[0] == '_':
         continue
       attribute_names.append(attribute_name)
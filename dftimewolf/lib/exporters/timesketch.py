@@ -11,6 +11,12 @@ from dftimewolf.lib import timesketch_utils
 from dftimewolf.lib.containers import containers
 from dftimewolf.lib.modules import manager as modules_manager
 
+# Regular expression used to extract a sketch ID from a Timesketch URL.
+_SKETCH_URL_RE = re.compile(r'sketch/(\d+)/')
+
+# Translation table used to derive timeline names from file names.
+_TIMELINE_NAME_TRANSLATION_TABLE = str.maketrans({' ': '_', '-': '_'})
+
 
 class TimesketchExporter(module.BaseModule):
   """Exports a given set of plaso or CSV files to Timesketch.
@@ -28,6 +34,12 @@ class TimesketchExporter(module.BaseModule):
   # The name of a ticket attribute that contains the URL to a sketch.
   _SKETCH_ATTRIBUTE_NAME = 'Timesketch URL'
 
+  # Delays, in seconds, used when polling for timelines to be processed.
+  _WAIT_FOR_TIMELINES_SETTLE_DELAY = 5.0
+  _WAIT_FOR_TIMELINES_INITIAL_DELAY = 1.0
+  _WAIT_FOR_TIMELINES_MAXIMUM_DELAY = 30.0
+  _WAIT_FOR_TIMELINES_BACKOFF_FACTOR = 1.6
+
   def __init__(self, state, name=None, critical=False):
     super(TimesketchExporter, self).__init__(
         state, name=name, critical=critical)
@@ -120,15 +132,25 @@ class TimesketchExporter(module.BaseModule):
     return sketch
 
   def _WaitForTimelines(self):
-    """Waits for all timelines in a sketch to be processed."""
-    time.sleep(5)  # Give Timesketch time to populate recently added timelines.
+    """Waits for all timelines in a sketch to be processed.
+
+    The sketch is polled with an exponentially increasing delay, so that
+    quickly processed timelines are picked up early while long running ones
+    do not flood the Timesketch server with requests.
+    """
+    # Give Timesketch time to populate recently added timelines.
+    time.sleep(self._WAIT_FOR_TIMELINES_SETTLE_DELAY)
     sketch = self.timesketch_api.get_sketch(self.sketch_id)
-    timelines = sketch.list_timelines()
+    delay = self._WAIT_FOR_TIMELINES_INITIAL_DELAY
     while True:
+      timelines = sketch.list_timelines()
       if all(tl.status in ['fail', 'ready', 'timeout', 'archived']
              for tl in timelines):
         break
-      time.sleep(10)
+      time.sleep(delay)
+      delay = min(
+          delay * self._WAIT_FOR_TIMELINES_BACKOFF_FACTOR,
+          self._WAIT_FOR_TIMELINES_MAXIMUM_DELAY)
 
   def _GetSketchIDFromAttributes(self):
     """Attempts to retrieve a Timesketch ID from ticket attributes.
@@ -137,12 +159,14 @@ class TimesketchExporter(module.BaseModule):
       int: the sketch idenifier, or None if one was not available.
     """
     attributes = self.state.GetContainers(containers.TicketAttribute)
-    for attribute in attributes:
-      if attribute.name == self._SKETCH_ATTRIBUTE_NAME:
-        sketch_match = re.search(r'sketch/(\d+)/', attribute.value)
-        if sketch_match:
-          sketch_id = int(sketch_match.group(1), 10)
-          return sketch_id
+    sketch_urls = [
+        attribute.value for attribute in attributes
+        if attribute.name == self._SKETCH_ATTRIBUTE_NAME]
+    for sketch_url in sketch_urls:
+      sketch_match = _SKETCH_URL_RE.search(sketch_url)
+      if sketch_match:
+        sketch_id = int(sketch_match.group(1), 10)
+        return sketch_id
     return None
 
   def Process(self):
@@ -162,14 +186,18 @@ class TimesketchExporter(module.BaseModule):
       self.logger.info('New sketch created: {0:d}'.format(self.sketch_id))
 
     recipe_name = self.state.recipe.get('name', 'no_recipe')
-    input_names = []
-    for file_container in self.state.GetContainers(containers.File):
-      description = file_container.name
-      if not description:
-        continue
-      name = description.rpartition('.')[0]
-      name = name.replace(' ', '_').replace('-', '_')
-      input_names.append(name)
+
+    # Take a single snapshot of the File containers, since the state returns
+    # its live list which other modules may still be appending to.
+    file_containers = list(self.state.GetContainers(containers.File))
+    paths = [file_container.path for file_container in file_containers]
+    names = [file_container.name for file_container in file_containers]
+    descriptions = [
+        file_container.description for file_container in file_containers]
+
+    input_names = [
+        name.rpartition('.')[0].translate(_TIMELINE_NAME_TRANSLATION_TABLE)
+        for name in names if name]
 
     if input_names:
       timeline_name = '{0:s}_{1:s}'.format(
@@ -181,9 +209,11 @@ class TimesketchExporter(module.BaseModule):
       streamer.set_sketch(sketch)
       streamer.set_timeline_name(timeline_name)
 
-      for file_container in self.state.GetContainers(containers.File):
-        path = file_container.path
-        description = file_container.description
+      # Files are uploaded sequentially: ImportStreamer keeps per upload state
+      # (chunk counter, timeline and index identifiers) that is not thread
+      # safe, and the first upload creates the timeline that later uploads
+      # are appended to.
+      for path, description in zip(paths, descriptions):
         streamer.add_file(path)
         if streamer.response and description:
           streamer.timeline.description = description
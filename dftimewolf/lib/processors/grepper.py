@@ -37,6 +37,7 @@ class GrepperSearch(module.BaseModule):
 
   def Process(self):
     """Executes grep on the module input."""
+    outputs = []
     for file_container in self.state.GetContainers(containers.File):
       path = file_container.path
       log_file_path = os.path.join(self._output_path, 'grepper.log')
@@ -59,15 +60,15 @@ class GrepperSearch(module.BaseModule):
             if [item for item in found if item]:
               output = '{0:s}/{1:s}:{2:s}'.format(path, filename, ','.join(
                   filter(None, sorted(found))))
-              if self._final_output:
-                self._final_output += '\n' + output
-              else:
-                self._final_output = output
+              outputs.append(output)
               self.logger.info(output)
       except OSError as exception:
         self.ModuleError(str(exception), critical=True)
       # Catch all remaining errors since we want to gracefully report them
 
+    if outputs:
+      self._final_output = '\n'.join(outputs)
+
   def GrepPDF(self, path):
     """Parses a PDF files text content for keywords.
 
@@ -79,12 +80,11 @@ class GrepperSearch(module.BaseModule):
     """
     with open(path, 'rb') as pdf_file_obj:
       matches = set()
-      text = ''
       pdf_reader = PyPDF2.PdfFileReader(pdf_file_obj)
       pages = pdf_reader.numPages
-      for page in range(pages):
-        page_obj = pdf_reader.getPage(page)
-        text += '\n' + page_obj.extractText()
+      text = ''.join(
+          '\n' + pdf_reader.getPage(page).extractText()
+          for page in range(pages))
       matches.update(set(x.lower() for x in re.findall(
           self._keywords, text, re.IGNORECASE)))
     return matches
@@ -81,18 +81,16 @@ class TurbiniaArtifactProcessor(TurbiniaProcessorBase):
 
     self.logger.info('Files generated by Turbinia:')
     for task_data in task_datas:
-      for task in task_data:
-        saved_paths = task.get('saved_paths') or []
-        for path in saved_paths:
-          # Ignore temporary files generated by turbinia
-          if path.startswith(turbinia_config.TMP_DIR):
-            continue
-
-          # We're only interested in plaso files for the time being.
-          if path.endswith('.plaso'):
-            self.logger.info('  {0:s}: {1:s}'.format(task['name'], path))
-            container = containers.RemoteFSPath(path=path)
-            self.state.StoreContainer(container)
+      for task, path in self._IterateSavedPaths(task_data):
+        # Ignore temporary files generated by turbinia
+        if path.startswith(turbinia_config.TMP_DIR):
+          continue
+
+        # We're only interested in plaso files for the time being.
+        if path.endswith('.plaso'):
+          self.logger.info('  {0:s}: {1:s}'.format(task['name'], path))
+          container = containers.RemoteFSPath(path=path)
+          self.state.StoreContainer(container)
 
 
 modules_manager.ModulesManager.RegisterModule(TurbiniaArtifactProcessor)
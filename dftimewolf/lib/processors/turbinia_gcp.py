@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 """Processes GCP cloud disks using Turbinia."""
 
+from concurrent import futures
 import getpass
 import os
 import tempfile
+import time
 
 # We import a class to avoid importing the whole turbinia module.
 from turbinia import TurbiniaException
@@ -34,6 +36,18 @@ class TurbiniaProcessorBase(module.BaseModule):
     turbinia_zone (str): GCP zone in which the Turbinia server is running.
   """
 
+  # Suffixes of the Turbinia output files that are collected.
+  _INTERESTING_PATH_SUFFIXES = (
+      '.plaso', 'BinaryExtractorTask.tar.gz', 'hashes.json')
+
+  # Maximum number of files downloaded concurrently from GCS.
+  _MAXIMUM_DOWNLOAD_THREADS = 8
+
+  # Intervals, in seconds, used when polling Turbinia for task progress.
+  _POLL_MINIMUM_INTERVAL = 5.0
+  _POLL_MAXIMUM_INTERVAL = 120.0
+  _POLL_BACKOFF_FACTOR = 1.5
+
   def __init__(self, state, name=None, critical=False):
     """Initializes a Turbinia base processor.
 
@@ -46,6 +60,7 @@ class TurbiniaProcessorBase(module.BaseModule):
     super(TurbiniaProcessorBase, self).__init__(
         state, name=name, critical=critical)
     self.turbinia_config_file = None
+    self._output_directory = None
     self._output_path = None
     self.client = None
     self.instance = None
@@ -72,25 +87,62 @@ class TurbiniaProcessorBase(module.BaseModule):
     """
     local_paths = []
     gs_paths = []
+    for _, path in self._IterateSavedPaths(task_data):
+      if not path.endswith(self._INTERESTING_PATH_SUFFIXES):
+        continue
+
+      if path.startswith('gs://'):
+        gs_paths.append(path)
+      else:
+        local_paths.append(path)
+
+    return local_paths, gs_paths
+
+  def _IterateSavedPaths(self, task_data):
+    """Iterates over the paths saved by Turbinia tasks.
+
+    Args:
+      task_data (list[dict]): List of dictionaries representing Turbinia task
+          data.
+
+    Yields:
+      tuple[dict, str]: the task and one of the paths it saved.
+    """
     for task in task_data:
       # saved_paths may be set to None
-      saved_paths = task.get('saved_paths') or []
-      for path in saved_paths:
+      for path in task.get('saved_paths') or ():
+        yield task, path
 
-        if path.endswith('.plaso') or \
-            path.endswith('BinaryExtractorTask.tar.gz') or \
-            path.endswith('hashes.json'):
+  def _DownloadFileFromGCS(self, gs_path):
+    """Downloads a file stored in Google Cloud Storage to the local filesystem.
 
-          if path.startswith('gs://'):
-            gs_paths.append(path)
-          else:
-            local_paths.append(path)
+    Args:
+      gs_path (str): gs:// URI to the file that needs to be downloaded.
 
-    return local_paths, gs_paths
+    Returns:
+      str: A local path where the file has been copied to, or None if the
+          file could not be downloaded.
+    """
+    local_path = None
+    try:
+      output_writer = output_manager.GCSOutputWriter(
+          gs_path, local_output_dir=self._output_path)
+      local_path = output_writer.copy_from(gs_path)
+    except TurbiniaException as exception:
+      # Don't add a critical error for now, until we start raising errors
+      # instead of returning manually each
+      self.ModuleError(str(exception), critical=False)
+
+    if local_path:
+      self.logger.info('Downloaded {0:s} to {1:s}'.format(gs_path, local_path))
+    return local_path
 
   def _DownloadFilesFromGCS(self, timeline_label, gs_paths):
     """Downloads files stored in Google Cloud Storage to the local filesystem.
 
+    Files are downloaded concurrently since each download is bound by the
+    latency of Google Cloud Storage.
+
     Args:
       timeline_label (str): Label to use to construct the path list.
       gs_paths (str):  gs:// URI to files that need to be downloaded from GS.
@@ -103,23 +155,53 @@ class TurbiniaProcessorBase(module.BaseModule):
     """
     # TODO: Externalize fetching files from GCS buckets to a different module.
 
-    local_paths = []
-    for path in gs_paths:
-      local_path = None
-      try:
-        output_writer = output_manager.GCSOutputWriter(
-            path, local_output_dir=self._output_path)
-        local_path = output_writer.copy_from(path)
-      except TurbiniaException as exception:
-        # Don't add a critical error for now, until we start raising errors
-        # instead of returning manually each
-        self.ModuleError(str(exception), critical=False)
-      self.logger.info('Downloaded {0:s} to {1:s}'.format(path, local_path))
-
-      if local_path:
-        local_paths.append((timeline_label, local_path))
-
-    return local_paths
+    if not gs_paths:
+      return []
+
+    max_workers = min(len(gs_paths), self._MAXIMUM_DOWNLOAD_THREADS)
+    with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+      downloaded_paths = list(
+          executor.map(self._DownloadFileFromGCS, gs_paths))
+
+    return [
+        (timeline_label, local_path) for local_path in downloaded_paths
+        if local_path]
+
+  def _WaitForRequest(self, request_dict):
+    """Polls Turbinia until all tasks of a request have completed.
+
+    The polling interval is reset to its minimum whenever more tasks have
+    completed since the previous poll, and grows up to its maximum while no
+    progress is made.
+
+    Args:
+      request_dict (dict[str, str]): Turbinia instance, project, region and
+          request ID of the request to wait for.
+
+    Returns:
+      list[dict]: The Turbinia task data of the completed request.
+    """
+    interval = self._POLL_MINIMUM_INTERVAL
+    last_completed_count = -1
+    while True:
+      task_data = self.client.get_task_data(**request_dict)
+      completed_count = len(
+          [task for task in task_data if task.get('successful') is not None])
+      if completed_count and completed_count == len(task_data):
+        break
+
+      if completed_count != last_completed_count:
+        self.logger.info('Tasks completed ({0:d}/{1:d})'.format(
+            completed_count, len(task_data)))
+        last_completed_count = completed_count
+        interval = self._POLL_MINIMUM_INTERVAL
+      else:
+        interval = min(
+            interval * self._POLL_BACKOFF_FACTOR, self._POLL_MAXIMUM_INTERVAL)
+      time.sleep(interval)
+
+    self.logger.info('All {0:d} tasks completed'.format(len(task_data)))
+    return task_data
 
   def TurbiniaSetUp(self, project, turbinia_zone, sketch_id, run_all_jobs):
     """Sets up the object attributes.
@@ -156,7 +238,10 @@ class TurbiniaProcessorBase(module.BaseModule):
           'disk into the same project.'.format(
               self.project, turbinia_config.TURBINIA_PROJECT), critical=True)
       return
-    self._output_path = tempfile.mkdtemp()
+    # The output directory is removed when the module is garbage collected or
+    # when dfTimewolf exits, after later modules have consumed its files.
+    self._output_directory = tempfile.TemporaryDirectory()
+    self._output_path = self._output_directory.name
     self.client = turbinia_client.get_turbinia_client(run_local=False)
 
   def TurbiniaProcess(self, evidence_):
@@ -207,8 +292,7 @@ class TurbiniaProcessorBase(module.BaseModule):
       self.client.send_request(request)
       self.logger.info('Waiting for Turbinia request {0:s} to complete'.format(
           request.request_id))
-      self.client.wait_for_request(**request_dict)
-      task_data = self.client.get_task_data(**request_dict)
+      task_data = self._WaitForRequest(request_dict)
     except TurbiniaException as exception:
       # TODO: determine if exception should be converted into a string as
       # elsewhere in the codebase.
@@ -279,7 +363,7 @@ class TurbiniaGCPProcessor(TurbiniaProcessorBase):
   def Process(self):
     """Process files with Turbinia."""
     log_file_path = os.path.join(self._output_path, 'turbinia.log')
-    print('Turbinia log file: {0:s}'.format(log_file_path))
+    self.logger.info('Turbinia log file: {0:s}'.format(log_file_path))
 
     vm_containers = self.state.GetContainers(containers.ForensicsVM)
     if vm_containers and not self.disk_name:
@@ -312,17 +396,19 @@ class TurbiniaGCPProcessor(TurbiniaProcessorBase):
       self.ModuleError('No interesting files could be found.', critical=True)
 
     for description, path in all_local_paths:
-      if path.endswith('BinaryExtractorTask.tar.gz'):
+      if path.endswith('.plaso'):
+        self.logger.info('Found plaso result: {0:s}'.format(path))
+        container = containers.File(name=description, path=path)
+      elif path.endswith('BinaryExtractorTask.tar.gz'):
         self.logger.info('Found BinaryExtractorTask result: {0:s}'.format(path))
         container = containers.ThreatIntelligence(
             name='BinaryExtractorResults', indicator=None, path=path)
-      if path.endswith('hashes.json'):
+      elif path.endswith('hashes.json'):
         self.logger.info('Found hashes.json: {0:s}'.format(path))
         container = containers.ThreatIntelligence(
             name='ImageExportHashes', indicator=None, path=path)
-      if path.endswith('.plaso'):
-        self.logger.info('Found plaso result: {0:s}'.format(path))
-        container = containers.File(name=description, path=path)
+      else:
+        continue
       self.state.StoreContainer(container)
 
 
@@ -1,9 +1,30 @@
 # -*- coding: utf-8 -*-
 """Tests for the attribute containers."""
 
+import inspect
+import os
+import tempfile
 import unittest
 
+import pandas
+
 from dftimewolf.lib.containers import containers
+from dftimewolf.lib.containers import interface
+
+
+class ContainerTypeTest(unittest.TestCase):
+  """Tests for the container types of the attribute containers."""
+
+  def testContainerTypes(self):
+    """Tests that container types are unique."""
+    container_types = set()
+    for _, container_class in inspect.getmembers(containers, inspect.isclass):
+      if not issubclass(container_class, interface.AttributeContainer):
+        continue
+      container_type = container_class.CONTAINER_TYPE
+      self.assertNotIn(container_type, container_types)
+      container_types.add(container_type)
+
 
 class ReportDataTest(unittest.TestCase):
   """Tests for the Report data attribute container."""
@@ -65,6 +86,64 @@ class RemoteFSPathDataTest(unittest.TestCase):
     self.assertEqual(attribute_names, expected_attribute_names)
 
 
+class DataFrameDataTest(unittest.TestCase):
+  """Tests for the DataFrame data attribute container."""
+
+  def testGetAttributeNames(self):
+    """Tests the GetAttributeNames function."""
+    attribute_container = containers.DataFrame(
+        data_frame=pandas.DataFrame(), description='description', name='name')
+
+    expected_attribute_names = ['data_frame', 'description', 'name']
+
+    attribute_names = sorted(attribute_container.GetAttributeNames())
+
+    self.assertEqual(attribute_names, expected_attribute_names)
+
+  def testGetContentHash(self):
+    """Tests the GetContentHash function."""
+    data_frame = pandas.DataFrame({'count': [1, 2], 'value': ['a', 'b']})
+    attribute_container = containers.DataFrame(
+        data_frame=data_frame, description='description', name='name')
+    content_hash = attribute_container.GetContentHash()
+    self.assertEqual(len(content_hash), 32)
+
+    same_container = containers.DataFrame(
+        data_frame=data_frame.copy(), description='other', name='other')
+    self.assertEqual(same_container.GetContentHash(), content_hash)
+
+    changed_values = data_frame.copy()
+    changed_values.loc[1, 'value'] = 'c'
+    changed_container = containers.DataFrame(
+        data_frame=changed_values, description='description', name='name')
+    self.assertNotEqual(changed_container.GetContentHash(), content_hash)
+
+    renamed_columns = data_frame.rename(columns={'value': 'other'})
+    renamed_container = containers.DataFrame(
+        data_frame=renamed_columns, description='description', name='name')
+    self.assertNotEqual(renamed_container.GetContentHash(), content_hash)
+
+  def testCache(self):
+    """Tests the WriteToCache and ReadFromCache functions."""
+    data_frames = [
+        pandas.DataFrame({'count': [1, 2], 'value': ['a', 'b']}),
+        pandas.DataFrame(
+            {'count': [1, 2], 'value': ['a', 'b']}).set_index('value')]
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+      for index, data_frame in enumerate(data_frames):
+        path = os.path.join(temporary_directory, str(index))
+        attribute_container = containers.DataFrame(
+            data_frame=data_frame, description='description', name='name')
+        attribute_container.WriteToCache(path)
+
+        cached_container = containers.DataFrame.ReadFromCache(
+            path, description='description', name='name')
+        pandas.testing.assert_frame_equal(
+            cached_container.data_frame, data_frame)
+        self.assertEqual(cached_container.description, 'description')
+        self.assertEqual(cached_container.name, 'name')
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -7,14 +7,31 @@ import unittest
 from dftimewolf.lib.containers import interface
 
 
+class TestAttributeContainer(interface.AttributeContainer):
+  """Attribute container for testing purposes."""
+  CONTAINER_TYPE = 'test_attribute_container'
+  __slots__ = ('attribute_name', 'attribute_value', '_private')
+
+  def __init__(self, attribute_name=None, attribute_value=None):
+    """Initializes the test attribute container.
+
+    Args:
+      attribute_name (Optional[str]): attribute name.
+      attribute_value (Optional[str]): attribute value.
+    """
+    super(TestAttributeContainer, self).__init__()
+    self.attribute_name = attribute_name
+    self.attribute_value = attribute_value
+    self._private = 'private'
+
+
 class AttributeContainerTest(unittest.TestCase):
   """Tests for the attribute container interface."""
 
   def testGetAttributeNames(self):
     """Tests the GetAttributeNames function."""
-    attribute_container = interface.AttributeContainer()
-    attribute_container.attribute_name = 'attribute_name'
-    attribute_container.attribute_value = 'attribute_value'
+    attribute_container = TestAttributeContainer(
+        attribute_name='attribute_name', attribute_value='attribute_value')
 
     expected_attribute_names = ['attribute_name', 'attribute_value']
 
@@ -22,6 +39,14 @@ class AttributeContainerTest(unittest.TestCase):
 
     self.assertEqual(attribute_names, expected_attribute_names)
 
+  def testSlots(self):
+    """Tests that attribute containers do not have a __dict__."""
+    attribute_container = TestAttributeContainer()
+    self.assertFalse(hasattr(attribute_container, '__dict__'))
+    with self.assertRaises(AttributeError):
+      # pylint: disable=assigning-non-slot
+      attribute_container.unknown_attribute = 'value'
+
 
 if __name__ == '__main__':
   unittest.main()
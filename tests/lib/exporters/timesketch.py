@@ -2,6 +2,8 @@
 # -*- coding: utf-8 -*-
 """Tests the Timesketch exporter."""
 
+import os
+import tempfile
 import unittest
 
 import mock
@@ -64,6 +66,62 @@ class TimesketchExporterTest(unittest.TestCase):
     self.assertEqual(
         error.exception.message, 'No write access to sketch ID 1234, aborting')
 
+  def testGetSketchIDFromAttributes(self):
+    """Tests that the sketch ID is extracted from ticket attributes."""
+    test_state = state.DFTimewolfState(config.Config)
+    test_state.StoreContainer(containers.TicketAttribute(
+        type_='text', name='Other URL', value='https://ts/sketch/1/'))
+    test_state.StoreContainer(containers.TicketAttribute(
+        type_='text', name='Timesketch URL', value='https://ts/'))
+    test_state.StoreContainer(containers.TicketAttribute(
+        type_='text', name='Timesketch URL', value='https://ts/sketch/42/'))
+    timesketch_exporter = timesketch.TimesketchExporter(test_state)
+    # pylint: disable=protected-access
+    self.assertEqual(timesketch_exporter._GetSketchIDFromAttributes(), 42)
+
+  # pylint: disable=invalid-name
+  @mock.patch('dftimewolf.lib.timesketch_utils.GetApiClient')
+  def testProcessCSVFileValues(self, mock_GetApiClient):
+    """Tests that CSV values are uploaded as they appear in the file."""
+    mock_response = mock.Mock()
+    mock_response.status_code = 201
+    mock_response.json.return_value = {
+        'objects': [{'id': 1, 'searchindex': {'index_name': 'test_index'}}],
+        'meta': {}}
+    mock_sketch = mock.Mock()
+    mock_sketch.id = 1234
+    mock_sketch.my_acl = ['write']
+    mock_sketch.api.api_root = 'timesketch.com/api/v1'
+    mock_sketch.api.session.post.return_value = mock_response
+    mock_api_client = mock.Mock()
+    mock_api_client.get_sketch.return_value = mock_sketch
+    mock_GetApiClient.return_value = mock_api_client
+    test_state = state.DFTimewolfState(config.Config)
+    test_state.recipe = {'name': 'test_recipe'}
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+      csv_path = os.path.join(temporary_directory, 'events.csv')
+      with open(csv_path, 'w') as csv_file:
+        csv_file.write(
+            'datetime,timestamp_desc,message,first_seen\n'
+            '2020-05-05T10:00:00+00:00,Event Time,Event,2020-05-05T10:00:00\n')
+      test_state.StoreContainer(containers.File(
+          name='events.csv', path=csv_path))
+      timesketch_exporter = timesketch.TimesketchExporter(test_state)
+      timesketch_exporter.SetUp(
+          incident_id=None,
+          sketch_id=1234,
+          analyzers=None
+      )
+      timesketch_exporter.Process()
+
+    events = [
+        call.kwargs['data']['events']
+        for call in mock_sketch.api.session.post.call_args_list
+        if 'events' in call.kwargs.get('data', {})]
+    self.assertEqual(len(events), 1)
+    self.assertIn('"first_seen":"2020-05-05T10:00:00"', events[0])
+
   # pylint: disable=invalid-name
   @mock.patch('timesketch_import_client.importer.ImportStreamer')
   @mock.patch('dftimewolf.lib.timesketch_utils.GetApiClient')
@@ -96,6 +154,70 @@ class TimesketchExporterTest(unittest.TestCase):
         'Your Timesketch URL is: timesketch.com/sketches/1234/')
     self.assertEqual(report.text_format, 'markdown')
 
+  # pylint: disable=invalid-name
+  @mock.patch('timesketch_import_client.importer.ImportStreamer')
+  @mock.patch('dftimewolf.lib.timesketch_utils.GetApiClient')
+  def testProcessFiles(self, mock_GetApiClient, mock_ImportStreamer):
+    """Tests that file containers are imported into a single timeline."""
+    mock_sketch = mock.Mock()
+    mock_sketch.id = 1234
+    mock_sketch.my_acl = ['write']
+    mock_sketch.api.api_root = 'timesketch.com/api/v1'
+    mock_api_client = mock.Mock()
+    mock_api_client.get_sketch.return_value = mock_sketch
+    mock_GetApiClient.return_value = mock_api_client
+    test_state = state.DFTimewolfState(config.Config)
+    test_state.recipe = {'name': 'test_recipe'}
+    test_state.StoreContainer(containers.File(
+        name='host-1 disk.plaso', path='/tmp/1.plaso', description='First'))
+    test_state.StoreContainer(containers.File(
+        name='host-2.csv', path='/tmp/2.csv'))
+    timesketch_exporter = timesketch.TimesketchExporter(test_state)
+    timesketch_exporter.SetUp(
+        incident_id=None,
+        sketch_id=1234,
+        analyzers=None
+    )
+    timesketch_exporter.Process()
+
+    mock_streamer = mock_ImportStreamer.return_value.__enter__.return_value
+    mock_streamer.set_timeline_name.assert_called_with(
+        'test_recipe_host_1_disk_host_2')
+    mock_streamer.add_file.assert_has_calls(
+        [mock.call('/tmp/1.plaso'), mock.call('/tmp/2.csv')])
+    self.assertEqual(mock_streamer.timeline.description, 'First')
+
+  # pylint: disable=invalid-name
+  @mock.patch('timesketch_import_client.importer.ImportStreamer')
+  @mock.patch('dftimewolf.lib.timesketch_utils.GetApiClient')
+  def testProcessReadsFilesOnce(self, mock_GetApiClient, _):
+    """Tests that the File containers are retrieved from the state once."""
+    mock_sketch = mock.Mock()
+    mock_sketch.id = 1234
+    mock_sketch.my_acl = ['write']
+    mock_sketch.api.api_root = 'timesketch.com/api/v1'
+    mock_api_client = mock.Mock()
+    mock_api_client.get_sketch.return_value = mock_sketch
+    mock_GetApiClient.return_value = mock_api_client
+    test_state = state.DFTimewolfState(config.Config)
+    test_state.recipe = {'name': 'test_recipe'}
+    test_state.StoreContainer(containers.File(name='a.plaso', path='/tmp/a'))
+    timesketch_exporter = timesketch.TimesketchExporter(test_state)
+    timesketch_exporter.SetUp(
+        incident_id=None,
+        sketch_id=1234,
+        analyzers=None
+    )
+    with mock.patch.object(
+        test_state, 'GetContainers',
+        wraps=test_state.GetContainers) as mock_GetContainers:
+      timesketch_exporter.Process()
+
+    file_calls = [
+        call for call in mock_GetContainers.call_args_list
+        if call.args[0] is containers.File]
+    self.assertEqual(len(file_calls), 1)
+
   # pylint: disable=invalid-name
   @mock.patch('time.sleep')
   @mock.patch('timesketch_import_client.importer.ImportStreamer')
@@ -133,6 +255,40 @@ class TimesketchExporterTest(unittest.TestCase):
     timesketch_exporter.Process()
     mock_sketch.list_timelines.assert_called_once()
 
+  # pylint: disable=invalid-name
+  @mock.patch('time.sleep')
+  @mock.patch('dftimewolf.lib.timesketch_utils.GetApiClient')
+  def testWaitForTimelinesBackoff(self, mock_GetApiClient, mock_sleep):
+    """Tests that timelines are polled with an increasing delay."""
+    mock_sketch = mock.Mock()
+    mock_sketch.id = 1234
+    mock_sketch.my_acl = ['write']
+    mock_api_client = mock.Mock()
+    mock_api_client.get_sketch.return_value = mock_sketch
+    mock_GetApiClient.return_value = mock_api_client
+
+    processing_timeline = mock.Mock()
+    processing_timeline.status = 'processing'
+    ready_timeline = mock.Mock()
+    ready_timeline.status = 'ready'
+    mock_sketch.list_timelines.side_effect = [
+        [processing_timeline], [processing_timeline], [ready_timeline]]
+
+    test_state = state.DFTimewolfState(config.Config)
+    timesketch_exporter = timesketch.TimesketchExporter(test_state)
+    timesketch_exporter.SetUp(
+        incident_id=None,
+        sketch_id=1234,
+        analyzers=None
+    )
+    # pylint: disable=protected-access
+    timesketch_exporter._WaitForTimelines()
+
+    self.assertEqual(mock_sketch.list_timelines.call_count, 3)
+    self.assertEqual(
+        mock_sleep.call_args_list,
+        [mock.call(5.0), mock.call(1.0), mock.call(1.6)])
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -62,6 +62,11 @@ class TurbiniaProcessorTest(unittest.TestCase):
     # pylint: disable=protected-access
     six.assertRegex(self, turbinia_processor._output_path,
                     '(/tmp/tmp|/var/folders).+')
+    self.assertTrue(os.path.isdir(turbinia_processor._output_path))
+
+    output_path = turbinia_processor._output_path
+    turbinia_processor._output_directory.cleanup()
+    self.assertFalse(os.path.exists(output_path))
 
   @mock.patch('turbinia.client.get_turbinia_client')
   # pylint: disable=invalid-name
@@ -151,6 +156,7 @@ class TurbiniaProcessorTest(unittest.TestCase):
         run_all_jobs=False)
 
     turbinia_processor.client.get_task_data.return_value = [{
+        'successful': True,
         'saved_paths': [
             '/fake/data.plaso',
             '/fake/data2.plaso',
@@ -182,7 +188,7 @@ class TurbiniaProcessorTest(unittest.TestCase):
     self.assertListEqual(
         request.recipe['jobs_denylist'],
         ['StringsJob', 'BinaryExtractorJob', 'BulkExtractorJob', 'PhotorecJob'])
-    turbinia_processor.client.get_task_data.assert_called()
+    turbinia_processor.client.get_task_data.assert_called_once()
     # pylint: disable=protected-access
     mock_GCSOutputWriter.assert_any_call(
         'gs://BinaryExtractorTask.tar.gz',
@@ -203,6 +209,29 @@ class TurbiniaProcessorTest(unittest.TestCase):
     self.assertEqual(file_containers[0].path, '/fake/data.plaso')
     self.assertEqual(file_containers[1].path, '/fake/data2.plaso')
 
+  @mock.patch('time.sleep')
+  def testWaitForRequest(self, mock_sleep):
+    """Tests that the polling interval adapts to task progress."""
+    test_state = state.DFTimewolfState(config.Config)
+    turbinia_processor = turbinia_gcp.TurbiniaGCPProcessor(test_state)
+    turbinia_processor.client = mock.Mock()
+    pending_task = {'successful': None}
+    completed_task = {'successful': True}
+    turbinia_processor.client.get_task_data.side_effect = [
+        [pending_task, pending_task],
+        [pending_task, pending_task],
+        [pending_task, pending_task],
+        [completed_task, pending_task],
+        [completed_task, completed_task],
+    ]
+    # pylint: disable=protected-access
+    task_data = turbinia_processor._WaitForRequest({'request_id': 'fake'})
+
+    self.assertEqual(task_data, [completed_task, completed_task])
+    self.assertEqual(turbinia_processor.client.get_task_data.call_count, 5)
+    mock_sleep.assert_has_calls([
+        mock.call(5.0), mock.call(7.5), mock.call(11.25), mock.call(5.0)])
+
   @mock.patch('turbinia.output_manager.GCSOutputWriter')
   # pylint: disable=invalid-name
   def testDownloadFilesFromGCS(self, mock_GCSOutputWriter):
@@ -221,6 +250,26 @@ class TurbiniaProcessorTest(unittest.TestCase):
         ('fake', '/fake/local/results.plaso')
     ])
 
+  @mock.patch('turbinia.output_manager.GCSOutputWriter')
+  # pylint: disable=invalid-name
+  def testDownloadFilesFromGCSError(self, mock_GCSOutputWriter):
+    """Tests that failed downloads are reported as non critical errors."""
+    def _fake_copy(filename):
+      if filename.endswith('.json'):
+        raise turbinia_gcp.TurbiniaException('Copy failed')
+      return '/fake/local/' + filename.rsplit('/')[-1]
+
+    test_state = state.DFTimewolfState(config.Config)
+    turbinia_processor = turbinia_gcp.TurbiniaGCPProcessor(test_state)
+    mock_GCSOutputWriter.return_value.copy_from = _fake_copy
+    fake_paths = ['gs://hashes.json', 'gs://results.plaso']
+    # pylint: disable=protected-access
+    local_paths = turbinia_processor._DownloadFilesFromGCS('fake', fake_paths)
+    self.assertEqual(local_paths, [('fake', '/fake/local/results.plaso')])
+    self.assertEqual(len(test_state.errors), 1)
+    self.assertEqual(test_state.errors[0].message, 'Copy failed')
+    self.assertFalse(test_state.errors[0].critical)
+
   def testDeterminePaths(self):
     """Tests _DeterminePaths"""
     test_state = state.DFTimewolfState(config.Config)
@@ -229,6 +278,8 @@ class TurbiniaProcessorTest(unittest.TestCase):
         'saved_paths': ['/local/path.plaso', '/ignoreme/'],
     }, {
         'saved_paths': ['gs://hashes.json', '/tmp/BinaryExtractorTask.tar.gz'],
+    }, {
+        'saved_paths': None,
     }]
     # pylint: disable=protected-access
     local_paths, gs_paths = turbinia_processor._DeterminePaths(fake_task_data)